@@ -0,0 +1,30 @@
+"""add covering index for gRPC GetVideo lookups
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Index-only scan for GetVideo: the key is the primary key, and the
+    # response columns ride along as non-key INCLUDE columns (PostgreSQL 11+)
+    op.create_index(
+        'idx_videos_get_video',
+        'videos',
+        ['id'],
+        postgresql_include=[
+            'title', 'filename', 'file_size', 'status', 'mime_type', 'created_at',
+            'original_filename', 'upload_method', 'file_hash'
+        ]
+    )
+
+def downgrade():
+    op.drop_index('idx_videos_get_video', table_name='videos')
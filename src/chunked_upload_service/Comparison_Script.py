@@ -143,9 +143,21 @@ class UploadComparison:
                 json=complete_data
             )
             
+            # Assembly runs in the background; wait for it so duration covers the whole upload
+            finalize = {}
+            if response.status_code == 202:
+                status_url = f"{CHUNKED_API}{response.json()['status_url']}"
+                deadline = time.time() + 120  # Allow time for assembly
+                while finalize.get('status') not in ('completed', 'failed'):
+                    if time.time() >= deadline:
+                        finalize = {'error': 'finalization timed out'}
+                        break
+                    time.sleep(0.2)
+                    finalize = requests.get(status_url).json()['data'].get('finalize') or {}
+            
             duration = time.time() - start_time
             
-            if response.status_code == 200:
+            if finalize.get('status') == 'completed':
                 throughput = file_size / duration
                 
                 print(f"Chunked Upload successful")
@@ -162,7 +174,7 @@ class UploadComparison:
                     'video_id': video_id
                 }
             else:
-                print(f"Completion failed: {response.status_code}")
+                print(f"Completion failed: {response.status_code} {finalize.get('error', '')}")
                 return {'success': False}
                 
         except Exception as e:
@@ -0,0 +1,28 @@
+"""Add (upload_method, created_at DESC) index to upload_metrics table.
+
+Revision ID: 010_add_upload_metrics_method_index
+Revises: 009_add_retry_count
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_add_upload_metrics_method_index'
+down_revision = '009_add_retry_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_upload_metrics_method_created_at',
+        'upload_metrics',
+        ['upload_method', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_upload_metrics_method_created_at', table_name='upload_metrics')
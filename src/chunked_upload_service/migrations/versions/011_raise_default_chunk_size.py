@@ -0,0 +1,25 @@
+"""Raise the default chunk_size of chunked_uploads to 8MB.
+
+Revision ID: 011_raise_default_chunk_size
+Revises: 010_add_upload_metrics_method_index
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_raise_default_chunk_size'
+down_revision = '010_add_upload_metrics_method_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches the default CHUNK_SIZE in the app config
+    op.alter_column('chunked_uploads', 'chunk_size', server_default='8388608')
+
+
+def downgrade() -> None:
+    op.alter_column('chunked_uploads', 'chunk_size', server_default='1048576')
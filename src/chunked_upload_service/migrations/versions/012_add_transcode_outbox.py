@@ -0,0 +1,32 @@
+"""Add transcode_outbox table for unpublished transcode jobs.
+
+Revision ID: 012_add_transcode_outbox
+Revises: 011_raise_default_chunk_size
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_add_transcode_outbox'
+down_revision = '011_raise_default_chunk_size'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'transcode_outbox',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('video_id', sa.String(36), sa.ForeignKey('videos.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('locked_until', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('transcode_outbox')
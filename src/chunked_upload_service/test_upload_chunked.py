@@ -1,11 +1,46 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import os
 import sys
 import random
+import mmap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 API_URL = "http://localhost:8002"
+MAX_RETRIES = 3
+UPLOAD_WORKERS = 8
+DEFAULT_CHUNK_SIZE_MB = 4
+MAX_CHUNK_SIZE_MB = 16  # Server's MAX_CHUNK_SIZE
+FAST_CHUNK_RTT = 0.1  # Seconds; faster chunks mean the next upload can use bigger ones
+
+def create_session(api_url=API_URL, pool_size=32):
+    """Keep-alive session that retries failed requests
+    
+    POSTs are only retried on the chunk endpoint; init and complete are not
+    idempotent, so they go through an adapter that leaves POST alone.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # Chunk uploads are idempotent, so POST is safe to retry there; the longer
+    # prefix takes precedence over the scheme mounts
+    chunk_adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry.new(allowed_methods=None)
+    )
+    session.mount(f"{api_url}/api/v1/upload/chunk", chunk_adapter)
+    return session
 
 class ChunkedUploadTester:
     """Test suite for chunked upload service"""
@@ -15,12 +50,16 @@ class ChunkedUploadTester:
         self.test_file = None
         self.upload_id = None
         self.video_id = None
+        self.session = create_session(api_url)
+        # Chunk size of the current upload, and the size picked for the next one
+        self.chunk_size_mb = DEFAULT_CHUNK_SIZE_MB
+        self.next_chunk_size_mb = DEFAULT_CHUNK_SIZE_MB
         
     def test_health_check(self):
         """Test health endpoint"""
         print("Testing health check...")
         try:
-            response = requests.get(f"{self.api_url}/health")
+            response = self.session.get(f"{self.api_url}/health")
             if response.status_code == 200:
                 print("Health check passed")
                 print(f"   Response: {response.json()}")
@@ -46,25 +85,27 @@ class ChunkedUploadTester:
         self.test_file = filename
         return filename
     
-    def initialize_upload(self, filename, chunk_size_mb=1):
-        """Test upload initialization"""
+    def initialize_upload(self, filename, chunk_size_mb=None):
+        """Test upload initialization; chunk size defaults to the adaptively tuned one"""
         print(f"\n📤 Initializing chunked upload for {filename}...")
         
         try:
+            self.chunk_size_mb = chunk_size_mb or self.next_chunk_size_mb
             file_size = os.path.getsize(filename)
-            chunk_size = chunk_size_mb * 1024 * 1024
+            chunk_size = self.chunk_size_mb * 1024 * 1024
             total_chunks = (file_size + chunk_size - 1) // chunk_size
             
             data = {
                 'filename': os.path.basename(filename),
                 'file_size': file_size,
                 'total_chunks': total_chunks,
+                'chunk_size': chunk_size,
                 'mime_type': 'video/mp4',
                 'title': 'Chunked Upload Test',
                 'uploader_id': 'test-user-456'
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/api/v1/upload/init",
                 json=data
             )
@@ -76,7 +117,7 @@ class ChunkedUploadTester:
                 print(f"Upload initialized!")
                 print(f"   Upload ID: {self.upload_id}")
                 print(f"   Video ID: {self.video_id}")
-                print(f"   Total chunks: {total_chunks}")
+                print(f"   Total chunks: {total_chunks} x {self.chunk_size_mb}MB")
                 print(f"   File size: {file_size / 1024 / 1024:.2f} MB")
                 return True, total_chunks
             else:
@@ -88,73 +129,94 @@ class ChunkedUploadTester:
             print(f"Initialization error: {e}")
             return False, 0
     
-    def upload_chunks(self, filename, total_chunks, chunk_size_mb=1, 
-                     simulate_failures=False, failure_rate=0.1):
-        """Upload file in chunks with optional failure simulation"""
-        print(f"\nUploading {total_chunks} chunks...")
+    def _post_chunk(self, mm, chunk_num, chunk_size):
+        """Upload one chunk sliced from the mapped file; returns (chunk_num, response, retries, error)"""
+        offset = (chunk_num - 1) * chunk_size
+        data = {
+            'upload_id': self.upload_id,
+            'chunk_number': str(chunk_num)
+        }
         
-        chunk_size = chunk_size_mb * 1024 * 1024
+        # The multipart body is built straight from a view of the mapping, so the chunk
+        # is copied once; views are released before the mapping can be closed
+        with memoryview(mm) as view, view[offset:offset + chunk_size] as chunk:
+            files = {'chunk': (f'chunk_{chunk_num}', chunk)}
+            # Retries with backoff are handled by the session's adapter
+            try:
+                response = self.session.post(
+                    f"{self.api_url}/api/v1/upload/chunk",
+                    files=files,
+                    data=data,
+                    timeout=30
+                )
+            except Exception as e:
+                return chunk_num, None, MAX_RETRIES, e
+        
+        history = getattr(response.raw, 'retries', None)
+        return chunk_num, response, len(history.history) if history else 0, None
+    
+    def _tune_chunk_size(self, rtts):
+        """Double the chunk size for the next upload while chunks round-trip quickly"""
+        if not rtts or self.next_chunk_size_mb >= MAX_CHUNK_SIZE_MB:
+            return
+        avg_rtt = sum(rtts) / len(rtts)
+        if avg_rtt < FAST_CHUNK_RTT:
+            self.next_chunk_size_mb = min(self.chunk_size_mb * 2, MAX_CHUNK_SIZE_MB)
+            print(f"   Avg chunk RTT {avg_rtt * 1000:.0f}ms, next upload uses {self.next_chunk_size_mb}MB chunks")
+    
+    def upload_chunks(self, filename, total_chunks, chunk_size_mb=None, 
+                     simulate_failures=False, failure_rate=0.1, workers=UPLOAD_WORKERS):
+        """Upload file in chunks concurrently with optional failure simulation"""
+        print(f"\nUploading {total_chunks} chunks with {workers} workers...")
+        
+        chunk_size = (chunk_size_mb or self.chunk_size_mb) * 1024 * 1024
         start_time = time.time()
         uploaded = 0
         failed = 0
         retries = 0
+        rtts = []
         
         try:
-            with open(filename, 'rb') as f:
+            with open(filename, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    ThreadPoolExecutor(max_workers=workers) as pool:
+                # Simulated failures are drawn up front as one Bernoulli mask over all chunks
+                failure_mask = random.choices(
+                    (True, False), weights=(failure_rate, 1 - failure_rate), k=total_chunks
+                ) if simulate_failures else None
+                
+                futures = []
                 for chunk_num in range(1, total_chunks + 1):
                     # Simulate random failures
-                    if simulate_failures and random.random() < failure_rate:
+                    if failure_mask is not None and failure_mask[chunk_num - 1]:
                         print(f"   Simulating failure for chunk {chunk_num}")
                         failed += 1
                         continue
                     
-                    chunk_data = f.read(chunk_size)
+                    futures.append(pool.submit(self._post_chunk, mm, chunk_num, chunk_size))
+                
+                for done, future in enumerate(as_completed(futures), 1):
+                    chunk_num, response, chunk_retries, error = future.result()
+                    retries += chunk_retries
                     
-                    # Upload chunk
-                    files = {'chunk': (f'chunk_{chunk_num}', chunk_data)}
-                    data = {
-                        'upload_id': self.upload_id,
-                        'chunk_number': str(chunk_num)
-                    }
+                    if error is not None:
+                        print(f"   Chunk {chunk_num} error: {error}")
+                        failed += 1
+                    elif response.status_code == 200:
+                        result = response.json()
+                        uploaded += 1
+                        rtts.append(response.elapsed.total_seconds())
+                        print(f"Chunk {chunk_num} upload result: {result}")
+                    else:
+                        print(f"   Chunk {chunk_num} failed: {response.status_code} after {chunk_retries} retries")
+                        print(f"   Response: {response.text}")
+                        failed += 1
                     
-                    max_retries = 3
-                    for attempt in range(max_retries):
-                        try:
-                            response = requests.post(
-                                f"{self.api_url}/api/v1/upload/chunk",
-                                files=files,
-                                data=data,
-                                timeout=30
-                            )
-                            
-                            if response.status_code == 200:
-                                result = response.json()
-                                uploaded += 1
-                                print(f"Chunk {chunk_num} upload result: {result}")
-                                
-                                if chunk_num % 10 == 0 or chunk_num == total_chunks:
-                                    progress = result.get('progress_percent', 0)
-                                    print(f"   Progress: {progress:.1f}% ({chunk_num}/{total_chunks})")
-                                break
-                            else:
-                                if attempt < max_retries - 1:
-                                    retries += 1
-                                    time.sleep(1)
-                                else:
-                                    print(f"   Chunk {chunk_num} failed after {max_retries} attempts")
-                                    failed += 1
-                                    
-                        except Exception as e:
-                            if attempt < max_retries - 1:
-                                retries += 1
-                                print(f"   Chunk {chunk_num} retry {attempt + 1}: {e}")
-                                time.sleep(1)
-                            else:
-                                print(f"   Chunk {chunk_num} error: {e}")
-                                failed += 1
-                                break
+                    if done % 10 == 0 or done == len(futures):
+                        print(f"   Progress: {done / total_chunks * 100:.1f}% ({done}/{total_chunks})")
             
             upload_time = time.time() - start_time
+            self._tune_chunk_size(rtts)
             
             print(f"\nUpload phase complete!")
             print(f"   Uploaded: {uploaded}/{total_chunks} chunks")
@@ -174,7 +236,7 @@ class ChunkedUploadTester:
         print(f"\nChecking upload status...")
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_url}/api/v1/upload/{self.upload_id}/status"
             )
             
@@ -199,7 +261,7 @@ class ChunkedUploadTester:
             print(f"Status error: {e}")
             return None
     
-    def resume_upload(self, filename, missing_chunks, chunk_size_mb=1):
+    def resume_upload(self, filename, missing_chunks, chunk_size_mb=None):
         """Resume upload by uploading missing chunks"""
         print(f"\n🔄 Resuming upload for {len(missing_chunks)} missing chunks...")
         
@@ -207,30 +269,20 @@ class ChunkedUploadTester:
             print("   No missing chunks, nothing to resume")
             return True
         
-        chunk_size = chunk_size_mb * 1024 * 1024
+        chunk_size = (chunk_size_mb or self.chunk_size_mb) * 1024 * 1024
         uploaded = 0
         
         try:
-            with open(filename, 'rb') as f:
-                for chunk_num in missing_chunks:
-                    # Seek to chunk position
-                    f.seek((chunk_num - 1) * chunk_size)
-                    chunk_data = f.read(chunk_size)
-                    
-                    files = {'chunk': (f'chunk_{chunk_num}', chunk_data)}
-                    data = {
-                        'upload_id': self.upload_id,
-                        'chunk_number': str(chunk_num)
-                    }
-                    
-                    response = requests.post(
-                        f"{self.api_url}/api/v1/upload/chunk",
-                        files=files,
-                        data=data,
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
+            with open(filename, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+                futures = [
+                    pool.submit(self._post_chunk, mm, chunk_num, chunk_size)
+                    for chunk_num in missing_chunks
+                ]
+                for future in as_completed(futures):
+                    chunk_num, response, _, error = future.result()
+                    if error is None and response.status_code == 200:
                         uploaded += 1
                         if uploaded % 5 == 0:
                             print(f"   Resumed {uploaded}/{len(missing_chunks)} chunks")
@@ -254,24 +306,36 @@ class ChunkedUploadTester:
                 'title': 'Chunked Upload Test - Completed'
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/api/v1/upload/complete",
-                json=data,
-                timeout=120  # Allow time for assembly
+                json=data
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                print(f"Upload completed successfully!")
-                print(f"   Video ID: {result['data']['id']}")
-                print(f"   Status: {result['data']['status']}")
-                print(f"   File hash: {result['data']['file_hash'][:16]}...")
-                print(f"   Throughput: {result['data']['throughput_bps'] / 1024 / 1024:.2f} MB/s")
-                return True
-            else:
+            if response.status_code != 202:
                 print(f"Completion failed: {response.status_code}")
                 print(f"   Response: {response.text}")
                 return False
+            
+            # Assembly runs in the background; poll the status endpoint for the result
+            status_url = f"{self.api_url}{response.json()['status_url']}"
+            deadline = time.time() + 120  # Allow time for assembly
+            while time.time() < deadline:
+                finalize = self.session.get(status_url).json()['data'].get('finalize') or {}
+                if finalize.get('status') == 'completed':
+                    result = finalize
+                    print(f"Upload completed successfully!")
+                    print(f"   Video ID: {result['data']['id']}")
+                    print(f"   Status: {result['data']['status']}")
+                    print(f"   File hash: {result['data']['file_hash'][:16]}...")
+                    print(f"   Throughput: {result['data']['throughput_bps'] / 1024 / 1024:.2f} MB/s")
+                    return True
+                if finalize.get('status') == 'failed':
+                    print(f"Completion failed: {finalize.get('error')}")
+                    return False
+                time.sleep(0.5)
+            
+            print("Completion timed out")
+            return False
                 
         except Exception as e:
             print(f"Completion error: {e}")
@@ -282,7 +346,7 @@ class ChunkedUploadTester:
         print(f"\nGetting upload metrics...")
         
         try:
-            response = requests.get(f"{self.api_url}/api/v1/metrics")
+            response = self.session.get(f"{self.api_url}/api/v1/metrics")
             
             if response.status_code == 200:
                 result = response.json()
@@ -323,12 +387,12 @@ def run_basic_test():
     test_file = tester.create_test_video(10, "basic.mp4")
     
     # Initialize upload
-    success, total_chunks = tester.initialize_upload(test_file, chunk_size_mb=1)
+    success, total_chunks = tester.initialize_upload(test_file)
     if not success:
         return False
     
     # Upload all chunks
-    uploaded, failed, retries = tester.upload_chunks(test_file, total_chunks, chunk_size_mb=1)
+    uploaded, failed, retries = tester.upload_chunks(test_file, total_chunks)
     
     if failed > 0:
         print(f"\n{failed} chunks failed, attempting to resume...")
@@ -360,7 +424,7 @@ def run_resilience_test():
     test_file = tester.create_test_video(20, "resilience.mp4")
     
     # Initialize upload
-    success, total_chunks = tester.initialize_upload(test_file, chunk_size_mb=1)
+    success, total_chunks = tester.initialize_upload(test_file)
     if not success:
         return False
     
@@ -368,7 +432,6 @@ def run_resilience_test():
     print("\nSimulating 20% network failure rate...")
     uploaded, failed, retries = tester.upload_chunks(
         test_file, total_chunks, 
-        chunk_size_mb=1,
         simulate_failures=True,
         failure_rate=0.2
     )
@@ -2,15 +2,30 @@
 gRPC Client for Video Service with resilience patterns
 """
 import os
+
+# Must be set before protobuf is first imported (video_pb2)
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
 import sys
+import time
+import queue
+import random
+import asyncio
 import grpc
 import logging
+import threading
+import itertools
+import urllib.request
+import weakref
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 # Add gRPC directory to path for direct execution
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
     sys.path.append(SCRIPT_DIR)
 
+from google.protobuf.internal import api_implementation
 import video_pb2
 import video_pb2_grpc
 from resiliency import (
@@ -19,12 +34,218 @@ from resiliency import (
 
 logger = logging.getLogger(__name__)
 
+# Chunk streaming is dominated by message (de)serialization; the pure-Python
+# protobuf backend is an order of magnitude slower than upb
+if api_implementation.Type() != 'upb':
+    logger.warning(f"protobuf is using the '{api_implementation.Type()}' backend, not upb")
+
+# Retries run inside gRPC via the channel's service config, not in a sleeping thread
+RETRY_CONFIG = RetryConfig(
+    max_attempts=3,
+    initial_backoff=1.0,
+    max_backoff=10.0,
+    backoff_multiplier=2.0,
+    retryable_status_codes=[
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED
+    ]
+)
+
+# HTTP/2 buffering matches the server; consecutive chunks coalesce into larger writes
+MAX_MESSAGE_LENGTH = int(os.getenv('GRPC_MAX_MESSAGE_LENGTH', 64 * 1024 * 1024))
+HTTP2_WRITE_BUFFER_SIZE = int(os.getenv('GRPC_HTTP2_WRITE_BUFFER_SIZE', 1024 * 1024))
+HTTP2_MAX_FRAME_SIZE = int(os.getenv('GRPC_HTTP2_MAX_FRAME_SIZE', 1024 * 1024))
+# Receive window for chunk streams: start wide and let BDP probing adjust it
+HTTP2_LOOKAHEAD_BYTES = int(os.getenv('GRPC_HTTP2_LOOKAHEAD_BYTES', 1024 * 1024))
+
+# Keepalive matches the server's ping policy; idle connections stay warm between calls
+CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.max_send_message_length', MAX_MESSAGE_LENGTH),
+    ('grpc.max_receive_message_length', MAX_MESSAGE_LENGTH),
+    ('grpc.http2.write_buffer_size', HTTP2_WRITE_BUFFER_SIZE),
+    ('grpc.http2.max_frame_size', HTTP2_MAX_FRAME_SIZE),
+    ('grpc.http2.lookahead_bytes', HTTP2_LOOKAHEAD_BYTES),
+    ('grpc.http2.bdp_probe', 1),
+    ('grpc.enable_retries', 1),
+    ('grpc.service_config', RETRY_CONFIG.service_config('video.VideoService'))
+]
+
+# Unary call deadline, jittered so clients that fail together don't retry in lockstep
+CALL_TIMEOUT = float(os.getenv('GRPC_CALL_TIMEOUT', 30))
+CALL_TIMEOUT_JITTER = 0.1
+
+# Per-thread request messages for blocking unary calls. The stub serializes the
+# request before the call returns, so each thread can refill one object per type
+_scratch = threading.local()
+
+def scratch_request(message_cls):
+    """This thread's reusable instance of a request message type"""
+    requests = getattr(_scratch, 'requests', None)
+    if requests is None:
+        requests = _scratch.requests = {}
+    request = requests.get(message_cls)
+    if request is None:
+        request = requests[message_cls] = message_cls()
+    return request
+
+def call_deadline():
+    """Per-call timeout with +/- CALL_TIMEOUT_JITTER applied"""
+    return CALL_TIMEOUT * random.uniform(1 - CALL_TIMEOUT_JITTER, 1 + CALL_TIMEOUT_JITTER)
+
+# Unix domain socket the server also listens on; used instead of TCP when the
+# server is on this host, skipping the loopback TCP stack
+GRPC_UDS_PATH = os.getenv('GRPC_UDS_PATH')
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+# Channels per target; each is its own HTTP/2 connection, so concurrent calls
+# aren't capped by one connection's stream limit
+CHANNEL_POOL_SIZE = int(os.getenv('GRPC_CHANNEL_POOL_SIZE', 4))
+
+# Matches the server default: 256KB minus the VideoChunk field overhead, large
+# enough to amortize the per-message cost of streaming
+STREAM_CHUNK_SIZE = 256 * 1024 - 64
+
+# Idle GetVideoChunksStreaming calls kept for reuse, and how long one may sit
+# idle before it is closed; each holds an HTTP/2 stream and a server coroutine
+CHUNK_SESSION_POOL_SIZE = int(os.getenv('GRPC_CHUNK_SESSION_POOL_SIZE', 32))
+CHUNK_SESSION_IDLE_TIMEOUT = float(os.getenv('GRPC_CHUNK_SESSION_IDLE_TIMEOUT', 60))  # seconds
+
+# Files above this size are downloaded over HTTP ranges instead of a gRPC stream;
+# ranges stay under the streaming service's 10MB per-request cap
+DIRECT_DOWNLOAD_THRESHOLD = 10 * 1024 * 1024
+DOWNLOAD_RANGE_SIZE = 8 * 1024 * 1024
+DOWNLOAD_WORKERS = int(os.getenv('GRPC_DOWNLOAD_WORKERS', 4))
+
+# Progress reports are coalesced into one ReportTranscodeProgressBatch call per window
+PROGRESS_BATCH_WINDOW = 0.001  # seconds
+PROGRESS_BATCH_MAX = 500
+
+# Client call results. metadata and video_ids are the response's own protobuf
+# containers (read-only mapping / sequence), not copies
+VideoInfo = namedtuple('VideoInfo', 'video_id title filename file_size status mime_type created_at metadata')
+StatusUpdate = namedtuple('StatusUpdate', 'success message timestamp')
+QueueStatus = namedtuple('QueueStatus', 'pending_jobs active_workers video_ids')
+
+# One channel pool per target, shared by all clients in the process
+_channels = {}
+_channels_lock = threading.Lock()
+
+def acquire_channels(target, pool_size=CHANNEL_POOL_SIZE):
+    """Get the shared channel pool for a target, creating it on first use"""
+    with _channels_lock:
+        entry = _channels.get(target)
+        if entry is None:
+            # A distinct arg per channel plus a local subchannel pool keeps gRPC
+            # from collapsing the pool onto a single connection
+            channels = [
+                grpc.insecure_channel(
+                    target,
+                    options=CHANNEL_OPTIONS + [
+                        ('grpc.channel_pool_index', i),
+                        ('grpc.use_local_subchannel_pool', 1)
+                    ],
+                    compression=grpc.Compression.Gzip
+                )
+                for i in range(pool_size)
+            ]
+            entry = _channels[target] = [channels, 0]
+        entry[1] += 1
+        return entry[0]
+
+def release_channels(target):
+    """Drop a reference to a shared channel pool, closing it when no client uses it"""
+    with _channels_lock:
+        entry = _channels.get(target)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _channels[target]
+            for channel in entry[0]:
+                channel.close()
+
+class VideoChunkSession:
+    """One GetVideoChunksStreaming call reused for every read of a video
+    
+    seek() sends a new ChunkRequest on the open stream; chunks the server had
+    already sent for the previous position are skipped by offset. Not safe for
+    concurrent use: VideoServiceClient checks a session out for one call at a time.
+    """
+    
+    def __init__(self, stub, video_id, quality, chunk_size=STREAM_CHUNK_SIZE):
+        self.video_id = video_id
+        self.quality = quality
+        self.chunk_size = chunk_size
+        self._position = None
+        self._requests = queue.Queue()
+        # Video bytes are already compressed; gzip would only cost CPU on both ends
+        self._call = stub.GetVideoChunksStreaming(
+            iter(self._requests.get, None),
+            compression=grpc.Compression.NoCompression
+        )
+    
+    def seek(self, offset):
+        """Restart the stream at offset"""
+        self._position = offset
+        self._requests.put(video_pb2.ChunkRequest(
+            video_id=self.video_id,
+            offset=offset,
+            chunk_size=self.chunk_size,
+            quality=self.quality
+        ))
+    
+    def chunks(self):
+        """Yield chunks from the current position through the last one"""
+        for chunk in self._call:
+            if chunk.offset != self._position:
+                continue
+            self._position += chunk.size
+            yield chunk
+            if chunk.is_last:
+                return
+    
+    def close(self):
+        """Half-close the request side and cancel the call"""
+        self._requests.put(None)
+        self._call.cancel()
+
 class VideoServiceClient:
     """Client for interacting with Video Service via gRPC with resilience patterns"""
     
-    def __init__(self, host='localhost', port=50051):
-        self.channel = grpc.insecure_channel(f'{host}:{port}')
-        self.stub = video_pb2_grpc.VideoServiceStub(self.channel)
+    def __init__(self, host='localhost', port=50051, pool_size=CHANNEL_POOL_SIZE, uds_path=GRPC_UDS_PATH):
+        if uds_path and host in LOCAL_HOSTS:
+            self.target = f'unix:{uds_path}'
+        else:
+            self.target = f'{host}:{port}'
+        self.channels = acquire_channels(self.target, pool_size)
+        self.stubs = [video_pb2_grpc.VideoServiceStub(channel) for channel in self.channels]
+        self._stub_iter = itertools.cycle(self.stubs)
+        self._stub_lock = threading.Lock()
+        
+        # asyncio channels for the async API, kept open between calls; aio channels
+        # belong to one event loop, so there is one per loop. A channel refers to
+        # its loop, so finished loops (e.g. one asyncio.run per call) are pruned
+        # explicitly when a channel is opened or closed rather than left to the
+        # weak keys
+        self._aio_channels = weakref.WeakKeyDictionary()
+        self._aio_lock = threading.Lock()
+        
+        # Idle GetVideoChunksStreaming calls keyed by (video_id, quality, chunk_size),
+        # least recently used first; each key maps to [(session, idle_since), ...]
+        self._chunk_sessions = OrderedDict()
+        self._chunk_sessions_lock = threading.Lock()
+        
+        # Background sender for batched progress reports; None is the stop signal
+        self._progress_queue = queue.Queue()
+        self._progress_thread = threading.Thread(
+            target=self._progress_sender, name='grpc-progress-batcher', daemon=True
+        )
+        self._progress_thread.start()
         
         # Configure resilience patterns
         self.circuit_config = CircuitConfig(
@@ -35,43 +256,55 @@ class VideoServiceClient:
             excluded_errors=[grpc.StatusCode.NOT_FOUND]
         )
         
-        self.retry_config = RetryConfig(
-            max_attempts=3,
-            initial_backoff=1.0,
-            max_backoff=10.0,
-            backoff_multiplier=2.0,
-            retryable_status_codes=[
-                grpc.StatusCode.UNAVAILABLE,
-                grpc.StatusCode.DEADLINE_EXCEEDED,
-                grpc.StatusCode.RESOURCE_EXHAUSTED
-            ]
-        )
+        self.retry_config = RETRY_CONFIG
         
         self.client_wrapper = GrpcClientWrapper(
             service_name="video_service",
             circuit_config=self.circuit_config,
-            retry_config=self.retry_config
+            retry_config=self.retry_config,
+            channel_retries=True
         )
     
+    def _next_stub(self):
+        """Pick the next stub round-robin across the channel pool"""
+        with self._stub_lock:
+            return next(self._stub_iter)
+    
+    def _aio_stub(self):
+        """Stub on the asyncio channel for the running loop, opening it on first use"""
+        loop = asyncio.get_running_loop()
+        with self._aio_lock:
+            channel = self._aio_channels.get(loop)
+            if channel is None:
+                self._drop_closed_loop_channels()
+                channel = grpc.aio.insecure_channel(self.target, options=CHANNEL_OPTIONS)
+                self._aio_channels[loop] = channel
+        return video_pb2_grpc.VideoServiceStub(channel)
+    
+    def _drop_closed_loop_channels(self):
+        """Forget channels whose loop has closed; they can no longer be awaited,
+        and releasing them lets the channel close on collection (caller holds _aio_lock)"""
+        for loop in [loop for loop in self._aio_channels if loop.is_closed()]:
+            del self._aio_channels[loop]
+    
     def get_video(self, video_id):
         """Get video information with resilience"""
         def _get_video():
-            request = video_pb2.VideoRequest(
-                video_id=video_id,
-                include_metadata=True
-            )
-            response = self.stub.GetVideo(request)
+            request = scratch_request(video_pb2.VideoRequest)
+            request.video_id = video_id
+            request.include_metadata = True
+            response = self._next_stub().GetVideo(request, timeout=call_deadline())
             
-            return {
-                'video_id': response.video_id,
-                'title': response.title,
-                'filename': response.filename,
-                'file_size': response.file_size,
-                'status': response.status,
-                'mime_type': response.mime_type,
-                'created_at': response.created_at,
-                'metadata': dict(response.metadata)
-            }
+            return VideoInfo(
+                response.video_id,
+                response.title,
+                response.filename,
+                response.file_size,
+                response.status,
+                response.mime_type,
+                response.created_at,
+                response.metadata
+            )
         
         try:
             return self.client_wrapper.call(_get_video)
@@ -82,19 +315,14 @@ class VideoServiceClient:
     def update_video_status(self, video_id, status, worker_id='client', message=''):
         """Update video processing status with resilience"""
         def _update_status():
-            request = video_pb2.UpdateStatusRequest(
-                video_id=video_id,
-                status=status,
-                worker_id=worker_id,
-                message=message
-            )
-            response = self.stub.UpdateVideoStatus(request)
+            request = scratch_request(video_pb2.UpdateStatusRequest)
+            request.video_id = video_id
+            request.status = status
+            request.worker_id = worker_id
+            request.message = message
+            response = self._next_stub().UpdateVideoStatus(request, timeout=call_deadline())
             
-            return {
-                'success': response.success,
-                'message': response.message,
-                'timestamp': response.timestamp
-            }
+            return StatusUpdate(response.success, response.message, response.timestamp)
         
         try:
             return self.client_wrapper.call(_update_status)
@@ -102,67 +330,249 @@ class VideoServiceClient:
             logger.error(f"Failed to update status for video {video_id}: {e.code()} - {e.details()}")
             return None
     
-    def stream_video_chunks(self, video_id, quality='720p', offset=0, chunk_size=65536):
-        """Stream video chunks with resilience"""
+    def stream_video_chunks(self, video_id, quality='720p', offset=0, chunk_size=STREAM_CHUNK_SIZE):
+        """Stream video chunks with resilience, reusing the video's open chunk stream"""
+        key = (video_id, quality, chunk_size)
+        
         def _stream_chunks():
-            request = video_pb2.ChunkRequest(
-                video_id=video_id,
-                offset=offset,
-                chunk_size=chunk_size,
-                quality=quality
-            )
+            session = self._checkout_chunk_session(key)
+            if session is None:
+                session = VideoChunkSession(self._next_stub(), video_id, quality, chunk_size)
             
             total_bytes = 0
             chunk_count = 0
             
-            for chunk in self.stub.GetVideoChunks(request):
+            try:
+                session.seek(offset)
+                for chunk in session.chunks():
+                    chunk_count += 1
+                    total_bytes += chunk.size
+                    
+                    logger.debug(f"Received chunk {chunk_count}: {chunk.size} bytes at offset {chunk.offset}")
+            except BaseException:
+                # The stream may be dead or mid-transfer; the next call opens a fresh one
+                session.close()
+                raise
+            self._return_chunk_session(key, session)
+            
+            logger.info(f"Stream complete: {chunk_count} chunks, {total_bytes} total bytes")
+            return {'chunks': chunk_count, 'total_bytes': total_bytes}
+        
+        try:
+            return self.client_wrapper.call(_stream_chunks)
+        except grpc.RpcError as e:
+            logger.error(f"Failed to stream video {video_id}: {e.code()} - {e.details()}")
+            return None
+    
+    def _checkout_chunk_session(self, key):
+        """Take an idle session for key out of the pool, or None if there is none"""
+        with self._chunk_sessions_lock:
+            expired = self._expire_chunk_sessions()
+            idle = self._chunk_sessions.get(key)
+            session = idle.pop()[0] if idle else None
+            if idle is not None and not idle:
+                del self._chunk_sessions[key]
+        for stale in expired:
+            stale.close()
+        return session
+    
+    def _return_chunk_session(self, key, session):
+        """Put a session back for reuse, closing the least recently used past the cap"""
+        with self._chunk_sessions_lock:
+            self._chunk_sessions.setdefault(key, []).append((session, time.monotonic()))
+            self._chunk_sessions.move_to_end(key)
+            expired = self._expire_chunk_sessions()
+            idle_count = sum(len(idle) for idle in self._chunk_sessions.values())
+            while idle_count > CHUNK_SESSION_POOL_SIZE:
+                oldest_key, idle = next(iter(self._chunk_sessions.items()))
+                expired.append(idle.pop(0)[0])
+                if not idle:
+                    del self._chunk_sessions[oldest_key]
+                idle_count -= 1
+        for stale in expired:
+            stale.close()
+    
+    def _expire_chunk_sessions(self):
+        """Remove sessions idle past CHUNK_SESSION_IDLE_TIMEOUT; caller holds the lock and closes them"""
+        cutoff = time.monotonic() - CHUNK_SESSION_IDLE_TIMEOUT
+        expired = []
+        for key in list(self._chunk_sessions):
+            idle = self._chunk_sessions[key]
+            expired.extend(session for session, idle_since in idle if idle_since < cutoff)
+            idle[:] = [(session, idle_since) for session, idle_since in idle if idle_since >= cutoff]
+            if not idle:
+                del self._chunk_sessions[key]
+        return expired
+    
+    async def stream_video_chunks_async(self, video_id, quality='720p', offset=0, chunk_size=STREAM_CHUNK_SIZE,
+                                        on_chunk=None, prefetch=4):
+        """Stream video chunks over an asyncio channel, receiving ahead of processing
+        
+        on_chunk, if given, runs in the default executor for each chunk with up to
+        `prefetch` chunks in flight, so processing may finish out of order; chunks
+        carry their offset. Unlike the sync call this bypasses the circuit breaker.
+        """
+        request = video_pb2.ChunkRequest(
+            video_id=video_id,
+            offset=offset,
+            chunk_size=chunk_size,
+            quality=quality
+        )
+        
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        total_bytes = 0
+        chunk_count = 0
+        
+        try:
+            call = self._aio_stub().GetVideoChunks(request, compression=grpc.Compression.NoCompression)
+            async for chunk in call:
                 chunk_count += 1
                 total_bytes += chunk.size
                 
-                logger.debug(f"Received chunk {chunk_count}: {chunk.size} bytes at offset {chunk.offset}")
+                if on_chunk is not None:
+                    if len(pending) >= prefetch:
+                        await pending.popleft()
+                    pending.append(loop.run_in_executor(None, on_chunk, chunk))
                 
                 if chunk.is_last:
                     logger.info(f"Stream complete: {chunk_count} chunks, {total_bytes} total bytes")
                     break
             
-            return {'chunks': chunk_count, 'total_bytes': total_bytes}
+            while pending:
+                await pending.popleft()
+        except grpc.RpcError as e:
+            logger.error(f"Failed to stream video {video_id}: {e.code()} - {e.details()}")
+            return None
+        
+        return {'chunks': chunk_count, 'total_bytes': total_bytes}
+    
+    def download_video(self, video_id, dest_path, quality='original', workers=DOWNLOAD_WORKERS):
+        """Download a video file to dest_path
+        
+        Large files are fetched from the URL returned by GetVideoDownloadURL
+        with parallel Range requests; small files, or a failed HTTP transfer,
+        go over GetVideoChunks.
+        """
+        def _get_download_url():
+            request = scratch_request(video_pb2.DownloadURLRequest)
+            request.video_id = video_id
+            request.quality = quality
+            return self._next_stub().GetVideoDownloadURL(request, timeout=call_deadline())
         
         try:
-            return self.client_wrapper.call(_stream_chunks)
+            target = self.client_wrapper.call(_get_download_url)
         except grpc.RpcError as e:
-            logger.error(f"Failed to stream video {video_id}: {e.code()} - {e.details()}")
+            logger.error(f"Failed to get download URL for video {video_id}: {e.code()} - {e.details()}")
             return None
+        
+        if target.size > DIRECT_DOWNLOAD_THRESHOLD:
+            try:
+                self._download_ranges(target.url, target.size, dest_path, workers)
+                return {'total_bytes': target.size, 'transport': 'http'}
+            except OSError as e:
+                logger.warning(f"HTTP download of video {video_id} failed, falling back to gRPC: {e}")
+        
+        def _download_chunks():
+            request = scratch_request(video_pb2.ChunkRequest)
+            request.video_id = video_id
+            request.offset = 0
+            request.chunk_size = STREAM_CHUNK_SIZE
+            request.quality = quality
+            total_bytes = 0
+            with open(dest_path, 'wb') as f:
+                for chunk in self._next_stub().GetVideoChunks(request, compression=grpc.Compression.NoCompression):
+                    f.write(chunk.data)
+                    total_bytes += chunk.size
+            return total_bytes
+        
+        try:
+            total_bytes = self.client_wrapper.call(_download_chunks)
+        except grpc.RpcError as e:
+            logger.error(f"Failed to download video {video_id}: {e.code()} - {e.details()}")
+            return None
+        
+        return {'total_bytes': total_bytes, 'transport': 'grpc'}
+    
+    @staticmethod
+    def _download_ranges(url, size, dest_path, workers):
+        """Fetch url into dest_path as parallel byte ranges written in place"""
+        fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            
+            def _fetch(start):
+                end = min(start + DOWNLOAD_RANGE_SIZE, size) - 1
+                request = urllib.request.Request(url, headers={'Range': f'bytes={start}-{end}'})
+                with urllib.request.urlopen(request, timeout=CALL_TIMEOUT) as response:
+                    data = response.read()
+                if len(data) != end - start + 1:
+                    raise OSError(f"Short range read at {start}: {len(data)} bytes")
+                os.pwrite(fd, data, start)
+            
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() re-raises the first failed range
+                list(pool.map(_fetch, range(0, size, DOWNLOAD_RANGE_SIZE)))
+        finally:
+            os.close(fd)
     
     def report_progress(self, video_id, worker_id, progress_percent, quality, message=''):
-        """Report transcoding progress with resilience"""
-        def _report_progress():
-            request = video_pb2.TranscodeProgressRequest(
-                video_id=video_id,
-                worker_id=worker_id,
-                progress_percent=progress_percent,
-                current_quality=quality,
-                message=message
-            )
-            response = self.stub.ReportTranscodeProgress(request)
+        """Queue a transcoding progress report; it is sent with the next batch"""
+        self._progress_queue.put_nowait(video_pb2.TranscodeProgressRequest(
+            video_id=video_id,
+            worker_id=worker_id,
+            progress_percent=progress_percent,
+            current_quality=quality,
+            message=message
+        ))
+        return True
+    
+    def _progress_sender(self):
+        """Drain queued progress reports into one batched RPC per window"""
+        while True:
+            item = self._progress_queue.get()
+            if item is None:
+                return
+            
+            # Give reports arriving in the same window a chance to join the batch
+            time.sleep(PROGRESS_BATCH_WINDOW)
+            items = [item]
+            stop = False
+            while len(items) < PROGRESS_BATCH_MAX:
+                try:
+                    item = self._progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
+            
+            self._send_progress_batch(items)
+            if stop:
+                return
+    
+    def _send_progress_batch(self, items):
+        """Send a batch of progress reports with resilience"""
+        def _report_batch():
+            request = video_pb2.TranscodeProgressBatchRequest(items=items)
+            response = self._next_stub().ReportTranscodeProgressBatch(request, timeout=call_deadline())
             return response.success
         
         try:
-            return self.client_wrapper.call(_report_progress)
+            return self.client_wrapper.call(_report_batch)
         except grpc.RpcError as e:
-            logger.error(f"Failed to report progress for video {video_id}: {e.code()} - {e.details()}")
+            logger.error(f"Failed to report progress for {len(items)} updates: {e.code()} - {e.details()}")
             return False
     
     def get_queue_status(self, queue_name='transcode_queue'):
         """Get transcoding queue status with resilience"""
         def _get_status():
-            request = video_pb2.QueueStatusRequest(queue_name=queue_name)
-            response = self.stub.GetQueueStatus(request)
+            request = scratch_request(video_pb2.QueueStatusRequest)
+            request.queue_name = queue_name
+            response = self._next_stub().GetQueueStatus(request, timeout=call_deadline())
             
-            return {
-                'pending_jobs': response.pending_jobs,
-                'active_workers': response.active_workers,
-                'video_ids': list(response.video_ids)
-            }
+            return QueueStatus(response.pending_jobs, response.active_workers, response.video_ids)
         
         try:
             return self.client_wrapper.call(_get_status)
@@ -175,8 +585,32 @@ class VideoServiceClient:
         return self.client_wrapper.circuit.get_metrics()
     
     def close(self):
-        """Close the gRPC channel"""
-        self.channel.close()
+        """Flush pending progress reports and release the shared gRPC channel pool"""
+        if self._progress_thread.is_alive():
+            self._progress_queue.put(None)
+            self._progress_thread.join(timeout=5)
+        with self._chunk_sessions_lock:
+            sessions = [session for idle in self._chunk_sessions.values() for session, _ in idle]
+            self._chunk_sessions.clear()
+        for session in sessions:
+            session.close()
+        if self.channels is not None:
+            self.channels = None
+            release_channels(self.target)
+    
+    async def close_async(self):
+        """close(), plus closing the running loop's asyncio channel
+        
+        Channels of loops that have already closed are dropped; a channel on
+        another loop that is still running must be closed from that loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._aio_lock:
+            channel = self._aio_channels.pop(loop, None)
+            self._drop_closed_loop_channels()
+        if channel is not None:
+            await channel.close()
+        self.close()
 
 
 def test_grpc_client(host='localhost', port=50051):
@@ -192,9 +626,9 @@ def test_grpc_client(host='localhost', port=50051):
     status = client.get_queue_status()
     if status:
         logger.info("Queue Status:")
-        logger.info(f"   Pending jobs: {status['pending_jobs']}")
-        logger.info(f"   Active workers: {status['active_workers']}")
-        logger.info(f"   Video IDs: {status['video_ids'][:3]}...")
+        logger.info(f"   Pending jobs: {status.pending_jobs}")
+        logger.info(f"   Active workers: {status.active_workers}")
+        logger.info(f"   Video IDs: {status.video_ids[:3]}...")
     
     # Test 2: Get client metrics
     logger.info("\nTesting Client Metrics...")
@@ -1,14 +1,16 @@
 """Circuit breaker and retry logic for gRPC services."""
 
 import time
+import json
 import logging
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar, Union
 from threading import Lock
 import grpc
 from functools import wraps
+from itertools import count
 
 logger = logging.getLogger(__name__)
 
@@ -37,23 +39,55 @@ class CircuitBreakerMetrics:
     failed_requests: int = 0
     rejected_requests: int = 0
     current_state: CircuitState = CircuitState.CLOSED
-    last_failure_time: Optional[datetime] = None
+    last_failure_time: Optional[float] = None  # time.monotonic()
     consecutive_failures: int = 0
     consecutive_successes: int = 0
-    failure_timestamps: List[datetime] = None
+    failure_timestamps: Deque[float] = None  # Last failure_threshold failures, monotonic
     avg_response_time: float = 0.0
 
+class CircuitOpenError(grpc.RpcError):
+    """Raised when an open circuit rejects a call."""
+    
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+    
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.UNAVAILABLE
+    
+    def details(self) -> str:
+        return self.message
+
 class CircuitBreaker:
-    """Circuit breaker pattern implementation."""
+    """Circuit breaker pattern implementation.
+    
+    Counters are itertools.count objects, whose next() is atomic, so the call
+    path never takes the lock; it is only acquired to change state. The
+    published metrics may trail in-flight calls by a request or two.
+    
+    While HALF_OPEN, a single probe call is let through at a time; everything
+    else is rejected until the probes close or reopen the circuit.
+    """
+    
+    EWMA_ALPHA = 0.05  # Weight of the newest sample in avg_response_time
     
     def __init__(self, name: str, config: CircuitConfig):
         self.name = name
         self.config = config
         self.state = CircuitState.CLOSED
         self.last_failure = None
-        self.metrics = CircuitBreakerMetrics(failure_timestamps=[])
+        self.metrics = CircuitBreakerMetrics(
+            failure_timestamps=deque(maxlen=config.failure_threshold)
+        )
         self.lock = Lock()
+        self._probe = Lock()  # Held by the in-flight HALF_OPEN probe
         self.excluded_errors = config.excluded_errors or []
+        self._total_requests = count(1)
+        self._successful_requests = count(1)
+        self._failed_requests = count(1)
+        self._rejected_requests = count(1)
+        self._consecutive_failures = count(1)
+        self._consecutive_successes = count(1)
         
     def _should_count_failure(self, error: grpc.RpcError) -> bool:
         """Determine if error should count towards failure threshold."""
@@ -61,85 +95,108 @@ class CircuitBreaker:
             return error.code() not in self.excluded_errors
         return True
     
+    def _transition(self, expected: CircuitState, new: CircuitState) -> bool:
+        """Move from expected to new state; False if another thread got there first."""
+        with self.lock:
+            if self.state != expected:
+                return False
+            self.state = new
+            self.metrics.current_state = new
+            return True
+    
     def _record_failure(self, error: grpc.RpcError) -> None:
         """Record a failure and potentially open the circuit."""
-        with self.lock:
-            now = datetime.utcnow()
-            self.metrics.failed_requests += 1
-            self.metrics.consecutive_failures += 1
-            self.metrics.consecutive_successes = 0
-            self.metrics.failure_timestamps.append(now)
-            self.metrics.last_failure_time = now
-            
-            # Remove old failures outside window
-            window_start = now - timedelta(seconds=self.config.window_size)
-            self.metrics.failure_timestamps = [
-                ts for ts in self.metrics.failure_timestamps
-                if ts > window_start
-            ]
-            
-            # Check if we should open the circuit
-            if (len(self.metrics.failure_timestamps) >= self.config.failure_threshold
-                and self.state == CircuitState.CLOSED):
-                self.state = CircuitState.OPEN
+        now = time.monotonic()
+        self.metrics.failed_requests = next(self._failed_requests)
+        self.metrics.consecutive_failures = next(self._consecutive_failures)
+        self._consecutive_successes = count(1)
+        self.metrics.consecutive_successes = 0
+        self.metrics.last_failure_time = now
+        
+        # The ring only holds the last failure_threshold failures, so the
+        # threshold is reached when the oldest of them is still in the window
+        window = self.metrics.failure_timestamps
+        window.append(now)
+        
+        # A failed probe sends the circuit straight back to OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            if self._transition(CircuitState.HALF_OPEN, CircuitState.OPEN):
                 self.last_failure = now
-                logger.warning(f"Circuit {self.name} opened due to failures")
-                self.metrics.current_state = CircuitState.OPEN
+                logger.warning(f"Circuit {self.name} reopened after failed probe")
+            return
+        
+        # Check if we should open the circuit
+        if self.state != CircuitState.CLOSED or len(window) < window.maxlen:
+            return
+        with self.lock:
+            if not window or now - window[0] > self.config.window_size:
+                return
+        if self._transition(CircuitState.CLOSED, CircuitState.OPEN):
+            self.last_failure = now
+            logger.warning(f"Circuit {self.name} opened due to failures")
     
     def _record_success(self) -> None:
         """Record a success and potentially close the circuit."""
-        with self.lock:
-            self.metrics.successful_requests += 1
-            self.metrics.consecutive_failures = 0
-            self.metrics.consecutive_successes += 1
-            
-            if (self.state == CircuitState.HALF_OPEN and
-                self.metrics.consecutive_successes >= self.config.success_threshold):
-                self.state = CircuitState.CLOSED
-                logger.info(f"Circuit {self.name} closed after success")
-                self.metrics.current_state = CircuitState.CLOSED
-                self.metrics.failure_timestamps = []
-    
-    def _check_state_transition(self) -> None:
-        """Check if circuit should transition states."""
-        with self.lock:
-            now = datetime.utcnow()
-            
-            if (self.state == CircuitState.OPEN and
-                self.last_failure and
-                (now - self.last_failure).seconds >= self.config.timeout):
-                self.state = CircuitState.HALF_OPEN
+        self.metrics.successful_requests = next(self._successful_requests)
+        self._consecutive_failures = count(1)
+        self.metrics.consecutive_failures = 0
+        consecutive = next(self._consecutive_successes)
+        self.metrics.consecutive_successes = consecutive
+        
+        if (self.state == CircuitState.HALF_OPEN and
+            consecutive >= self.config.success_threshold and
+            self._transition(CircuitState.HALF_OPEN, CircuitState.CLOSED)):
+            logger.info(f"Circuit {self.name} closed after success")
+            with self.lock:
+                self.metrics.failure_timestamps.clear()
+    
+    def _admit(self) -> Tuple[bool, bool]:
+        """Decide whether a call may proceed; returns (admitted, is_probe)."""
+        if self.state == CircuitState.CLOSED:
+            return True, False
+        
+        if self.state == CircuitState.OPEN:
+            if (self.last_failure is None or
+                time.monotonic() - self.last_failure < self.config.timeout):
+                return False, False
+            if self._transition(CircuitState.OPEN, CircuitState.HALF_OPEN):
+                self._consecutive_successes = count(1)
                 logger.info(f"Circuit {self.name} entering half-open state")
-                self.metrics.current_state = CircuitState.HALF_OPEN
+        
+        # Non-blocking acquire is an atomic test-and-set: one probe at a time
+        if not self._probe.acquire(blocking=False):
+            return False, False
+        if self.state == CircuitState.HALF_OPEN:
+            return True, True
+        self._probe.release()
+        return self.state == CircuitState.CLOSED, False
     
     def get_metrics(self) -> CircuitBreakerMetrics:
         """Get current circuit breaker metrics."""
-        with self.lock:
-            return self.metrics
+        return self.metrics
     
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
         """Decorator for protecting gRPC calls."""
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            self._check_state_transition()
-            
-            if self.state == CircuitState.OPEN:
-                self.metrics.rejected_requests += 1
-                raise grpc.RpcError(
-                    'Circuit breaker is OPEN. Too many recent failures.'
-                )
+            admitted, is_probe = self._admit()
+            if not admitted:
+                self.metrics.rejected_requests = next(self._rejected_requests)
+                raise CircuitOpenError('Circuit breaker is OPEN. Too many recent failures.')
             
             try:
-                start_time = time.time()
-                self.metrics.total_requests += 1
+                start_time = time.monotonic()
+                self.metrics.total_requests = next(self._total_requests)
                 
                 result = func(*args, **kwargs)
                 
-                # Update response time metrics
-                duration = time.time() - start_time
+                # Exponentially weighted average; a lost concurrent update only
+                # drops one sample, so no lock is needed
+                duration = time.monotonic() - start_time
+                avg = self.metrics.avg_response_time
                 self.metrics.avg_response_time = (
-                    (self.metrics.avg_response_time * (self.metrics.total_requests - 1) + duration)
-                    / self.metrics.total_requests
+                    duration if avg == 0.0
+                    else avg + self.EWMA_ALPHA * (duration - avg)
                 )
                 
                 self._record_success()
@@ -150,8 +207,70 @@ class CircuitBreaker:
                     self._record_failure(e)
                 raise
             
+            finally:
+                if is_probe:
+                    self._probe.release()
+            
         return wrapper
 
+@dataclass
+class LimiterConfig:
+    """AIMD concurrency limiter configuration."""
+    initial_limit: int = 20
+    min_limit: int = 1
+    max_limit: int = 200
+    increase: float = 1.0        # Added to the limit after a fast success
+    decrease: float = 0.5        # Limit multiplier after a failure
+    latency_target: float = 1.0  # Seconds; slower successes don't raise the limit
+
+class LoadShedError(grpc.RpcError):
+    """Raised when the concurrency limiter rejects a call."""
+    
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+    
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.RESOURCE_EXHAUSTED
+    
+    def details(self) -> str:
+        return self.message
+
+class AIMDLimiter:
+    """Adaptive cap on in-flight calls: additive increase, multiplicative decrease.
+    
+    Calls over the limit are rejected rather than queued, so an overloaded
+    backend sheds load before the circuit breaker has to trip.
+    """
+    
+    def __init__(self, config: LimiterConfig):
+        self.config = config
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        self.lock = Lock()
+    
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free; never blocks."""
+        with self.lock:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+    
+    def release(self, latency: Optional[float], failed: bool) -> None:
+        """Return a slot and adapt the limit to how the call went.
+        
+        A latency of None means the call never ran; the limit is left alone.
+        """
+        with self.lock:
+            self.in_flight -= 1
+            if latency is None:
+                return
+            if failed:
+                self.limit = max(self.config.min_limit, self.limit * self.config.decrease)
+            elif latency <= self.config.latency_target:
+                self.limit = min(self.config.max_limit, self.limit + self.config.increase)
+
 class RetryConfig:
     """Configuration for retry behavior."""
     def __init__(
@@ -171,6 +290,24 @@ class RetryConfig:
             grpc.StatusCode.DEADLINE_EXCEEDED,
             grpc.StatusCode.RESOURCE_EXHAUSTED
         ]
+    
+    def service_config(self, service: str) -> str:
+        """Equivalent gRPC retry policy as a grpc.service_config channel option.
+        
+        gRPC retries in its own event loop and adds jitter to each backoff.
+        """
+        return json.dumps({
+            'methodConfig': [{
+                'name': [{'service': service}],
+                'retryPolicy': {
+                    'maxAttempts': self.max_attempts,
+                    'initialBackoff': f'{self.initial_backoff}s',
+                    'maxBackoff': f'{self.max_backoff}s',
+                    'backoffMultiplier': self.backoff_multiplier,
+                    'retryableStatusCodes': [code.name for code in self.retryable_status_codes]
+                }
+            }]
+        })
 
 def retry_on_error(config: RetryConfig):
     """Decorator for retrying failed gRPC calls."""
@@ -214,20 +351,51 @@ class GrpcClientWrapper:
         self,
         service_name: str,
         circuit_config: Optional[CircuitConfig] = None,
-        retry_config: Optional[RetryConfig] = None
+        retry_config: Optional[RetryConfig] = None,
+        channel_retries: bool = False,
+        limiter_config: Optional[LimiterConfig] = None
     ):
+        """Set channel_retries when the channel's service config already applies
+        retry_config (see RetryConfig.service_config); calls then skip the
+        Python-level retry loop.
+        """
         self.service_name = service_name
         self.circuit = CircuitBreaker(
             service_name,
             circuit_config or CircuitConfig()
         )
         self.retry_config = retry_config or RetryConfig()
+        self.channel_retries = channel_retries
+        self.limiter = AIMDLimiter(limiter_config or LimiterConfig())
     
     def call(self, func: Callable[..., T], *args, **kwargs) -> T:
-        """Make a gRPC call with circuit breaker and retry logic."""
-        @self.circuit
-        @retry_on_error(self.retry_config)
-        def wrapped_call():
-            return func(*args, **kwargs)
+        """Make a gRPC call with concurrency limiting, circuit breaker and retry logic."""
+        if not self.limiter.try_acquire():
+            logger.warning(
+                f"Shedding call to {self.service_name}: "
+                f"{self.limiter.in_flight} in flight, limit {int(self.limiter.limit)}"
+            )
+            raise LoadShedError(f'{self.service_name} concurrency limit reached')
+        
+        start_time = time.monotonic()
+        failed = False
+        rejected = False
+        try:
+            if self.channel_retries:
+                return self.circuit(func)(*args, **kwargs)
+            
+            @self.circuit
+            @retry_on_error(self.retry_config)
+            def wrapped_call():
+                return func(*args, **kwargs)
+            
+            return wrapped_call()
+        
+        except grpc.RpcError as e:
+            # An open-circuit rejection never reached the backend, so it says nothing about load
+            rejected = isinstance(e, CircuitOpenError)
+            failed = not rejected and self.circuit._should_count_failure(e)
+            raise
         
-        return wrapped_call()
\ No newline at end of file
+        finally:
+            self.limiter.release(None if rejected else time.monotonic() - start_time, failed)
\ No newline at end of file
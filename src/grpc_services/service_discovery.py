@@ -9,6 +9,16 @@ import redis
 from dataclasses import dataclass
 from datetime import datetime
 
+# orjson is several times faster than json for metadata (de)serialization and
+# writes the same JSON, so entries stay readable by registries without it
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -50,15 +60,15 @@ class ServiceRegistry:
                 "port": port,
                 "status": "active",
                 "last_heartbeat": datetime.utcnow().isoformat(),
-                "metadata": json.dumps(metadata or {})
+                "metadata": _dumps(metadata or {})
             }
             
-            # Store node data with TTL
-            self.redis.hmset(node_key, node_data)
-            self.redis.expire(node_key, self.node_ttl)
-            
-            # Add to service set
-            self.redis.sadd(service_key, node_id)
+            # Store node data with TTL and add to service set in one round trip
+            pipe = self.redis.pipeline()
+            pipe.hset(node_key, mapping=node_data)
+            pipe.expire(node_key, self.node_ttl)
+            pipe.sadd(service_key, node_id)
+            pipe.execute()
             
             logger.info(f"Registered node {node_id} for service {service_name}")
             return True
@@ -73,11 +83,11 @@ class ServiceRegistry:
             node_key = f"{self.node_prefix}{service_name}:{node_id}"
             service_key = f"{self.service_prefix}{service_name}"
             
-            # Remove node data
-            self.redis.delete(node_key)
-            
-            # Remove from service set
-            self.redis.srem(service_key, node_id)
+            # Remove node data and its service set entry
+            pipe = self.redis.pipeline()
+            pipe.delete(node_key)
+            pipe.srem(service_key, node_id)
+            pipe.execute()
             
             logger.info(f"Deregistered node {node_id} from service {service_name}")
             return True
@@ -92,8 +102,10 @@ class ServiceRegistry:
             node_key = f"{self.node_prefix}{service_name}:{node_id}"
             
             # Update last heartbeat
-            self.redis.hset(node_key, "last_heartbeat", datetime.utcnow().isoformat())
-            self.redis.expire(node_key, self.node_ttl)
+            pipe = self.redis.pipeline()
+            pipe.hset(node_key, "last_heartbeat", datetime.utcnow().isoformat())
+            pipe.expire(node_key, self.node_ttl)
+            pipe.execute()
             
             return True
             
@@ -108,14 +120,14 @@ class ServiceRegistry:
             nodes = []
             
             # Get all node IDs for service
-            node_ids = self.redis.smembers(service_key)
+            node_ids = self._node_ids(service_key)
             
+            # Fetch every node's data in one round trip
+            pipe = self.redis.pipeline(transaction=False)
             for node_id in node_ids:
-                node_id = node_id.decode() if isinstance(node_id, bytes) else node_id
-                node_key = f"{self.node_prefix}{service_name}:{node_id}"
-                
-                # Get node data
-                data = self.redis.hgetall(node_key)
+                pipe.hgetall(f"{self.node_prefix}{service_name}:{node_id}")
+            
+            for data in pipe.execute():
                 if not data:
                     continue
                 
@@ -128,7 +140,7 @@ class ServiceRegistry:
                     port=int(data["port"]),
                     status=data["status"],
                     last_heartbeat=datetime.fromisoformat(data["last_heartbeat"]),
-                    metadata=json.loads(data["metadata"])
+                    metadata=_loads(data["metadata"])
                 ))
             
             return nodes
@@ -137,6 +149,13 @@ class ServiceRegistry:
             logger.error(f"Error getting service nodes: {e}")
             return []
     
+    def _node_ids(self, service_key: str) -> List[str]:
+        """Node IDs registered under a service key."""
+        return [
+            node_id.decode() if isinstance(node_id, bytes) else node_id
+            for node_id in self.redis.smembers(service_key)
+        ]
+    
     def update_node_status(self, service_name: str, node_id: str, status: str) -> bool:
         """Update a node's status."""
         try:
@@ -152,38 +171,81 @@ class ServiceRegistry:
         """Remove expired nodes."""
         try:
             service_key = f"{self.service_prefix}{service_name}"
-            node_ids = self.redis.smembers(service_key)
-            removed = 0
+            node_ids = self._node_ids(service_key)
             
+            # Check which nodes still exist in one round trip
+            pipe = self.redis.pipeline(transaction=False)
             for node_id in node_ids:
-                node_id = node_id.decode() if isinstance(node_id, bytes) else node_id
-                node_key = f"{self.node_prefix}{service_name}:{node_id}"
-                
-                # Check if node still exists
-                if not self.redis.exists(node_key):
-                    self.redis.srem(service_key, node_id)
-                    removed += 1
+                pipe.exists(f"{self.node_prefix}{service_name}:{node_id}")
+            expired = [
+                node_id for node_id, exists in zip(node_ids, pipe.execute())
+                if not exists
+            ]
             
-            return removed
+            if expired:
+                self.redis.srem(service_key, *expired)
+            return len(expired)
             
         except Exception as e:
             logger.error(f"Error cleaning up nodes: {e}")
             return 0
     
+    def _enable_expiry_events(self) -> None:
+        """Turn on keyevent notifications for expired keys, keeping other flags."""
+        flags = self.redis.config_get("notify-keyspace-events").get("notify-keyspace-events", "")
+        if isinstance(flags, bytes):
+            flags = flags.decode()
+        missing = "".join(
+            flag for flag in "Ex"
+            if flag not in flags and not (flag == "x" and "A" in flags)
+        )
+        if missing:
+            self.redis.config_set("notify-keyspace-events", flags + missing)
+    
+    def _handle_expired_key(self, key) -> None:
+        """Drop an expired node key's ID from its service set."""
+        key = key.decode() if isinstance(key, bytes) else key
+        if not key.startswith(self.node_prefix):
+            return
+        service_name, _, node_id = key[len(self.node_prefix):].partition(":")
+        if node_id and self.redis.srem(f"{self.service_prefix}{service_name}", node_id):
+            logger.info(f"Removed expired node {node_id} from {service_name}")
+    
     def monitor_services(self):
-        """Background task to monitor services and cleanup."""
+        """Background task removing nodes from their service sets as they expire.
+        
+        Driven by Redis expired-key events instead of polling. Each (re)connect
+        first sweeps every service with SCAN, catching nodes that expired while
+        nothing was subscribed.
+        """
         while True:
+            pubsub = None
             try:
-                # Get all services
-                services = self.redis.keys(f"{self.service_prefix}*")
+                try:
+                    self._enable_expiry_events()
+                except redis.ResponseError as e:
+                    # CONFIG can be disabled on managed Redis; it must then be preconfigured
+                    logger.warning(f"Could not enable keyspace notifications: {e}")
                 
-                for service in services:
-                    service_name = service.decode().split(":", 1)[1]
+                db = self.redis.connection_pool.connection_kwargs.get("db", 0)
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(f"__keyevent@{db}__:expired")
+                
+                for service in self.redis.scan_iter(match=f"{self.service_prefix}*"):
+                    service = service.decode() if isinstance(service, bytes) else service
+                    service_name = service.split(":", 1)[1]
                     removed = self.cleanup_expired_nodes(service_name)
                     if removed > 0:
                         logger.info(f"Removed {removed} expired nodes from {service_name}")
                 
+                for message in pubsub.listen():
+                    self._handle_expired_key(message["data"])
+                
             except Exception as e:
                 logger.error(f"Error monitoring services: {e}")
             
-            time.sleep(self.heartbeat_interval)
\ No newline at end of file
+            finally:
+                if pubsub is not None:
+                    pubsub.close()
+            
+            time.sleep(self.heartbeat_interval)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bvideo.proto\x12\x05video\":\n\x0cVideoRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x18\n\x10include_metadata\x18\x02 \x01(\x08\"\xf3\x01\n\rVideoResponse\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x11\n\tfile_size\x18\x04 \x01(\x03\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x11\n\tmime_type\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x34\n\x08metadata\x18\x08 \x03(\x0b\x32\".video.VideoResponse.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"[\n\x13UpdateStatusRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x11\n\tworker_id\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\"E\n\x0eStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"U\n\x0c\x43hunkRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x12\n\nchunk_size\x18\x03 \x01(\x05\x12\x0f\n\x07quality\x18\x04 \x01(\t\"I\n\nVideoChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0c\n\x04size\x18\x03 \x01(\x05\x12\x0f\n\x07is_last\x18\x04 \x01(\x08\"\x83\x01\n\x18TranscodeProgressRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x18\n\x10progress_percent\x18\x03 \x01(\x05\x12\x17\n\x0f\x63urrent_quality\x18\x04 \x01(\t\x12\x0f\n\x07message\x18\x05 \x01(\t\"(\n\x12QueueStatusRequest\x12\x12\n\nqueue_name\x18\x01 \x01(\t\"V\n\x13QueueStatusResponse\x12\x14\n\x0cpending_jobs\x18\x01 \x01(\x05\x12\x16\n\x0e\x61\x63tive_workers\x18\x02 \x01(\x05\x12\x11\n\tvideo_ids\x18\x03 \x03(\t\"j\n\x11ListVideosRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x10\n\x08per_page\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x13\n\x0buploader_id\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x05 \x01(\t\"i\n\x12ListVideosResponse\x12$\n\x06videos\x18\x01 \x03(\x0b\x32\x14.video.VideoResponse\x12\r\n\x05total\x18\x02 \x01(\x05\x12\x0c\n\x04page\x18\x03 \x01(\x05\x12\x10\n\x08per_page\x18\x04 \x01(\x05\"D\n\x13SearchVideosRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\x10\n\x08per_page\x18\x03 \x01(\x05\"\xfb\x01\n\x12VideoStatsResponse\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x12\n\nview_count\x18\x02 \x01(\x03\x12\x12\n\nlike_count\x18\x03 \x01(\x03\x12\x1a\n\x12total_bytes_served\x18\x04 \x01(\x03\x12\x16\n\x0etotal_requests\x18\x05 \x01(\x03\x12\x42\n\rquality_stats\x18\x06 \x03(\x0b\x32+.video.VideoStatsResponse.QualityStatsEntry\x1a\x33\n\x11QualityStatsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"P\n\x18\x42\x61tchUpdateStatusRequest\x12\x11\n\tvideo_ids\x18\x01 \x03(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x11\n\tworker_id\x18\x03 \x01(\t\"]\n\x13\x42\x61tchStatusResponse\x12\x15\n\rsuccess_count\x18\x01 \x01(\x05\x12\x15\n\rfailure_count\x18\x02 \x01(\x05\x12\x18\n\x10\x66\x61iled_video_ids\x18\x03 \x03(\t2\x82\x05\n\x0cVideoService\x12\x35\n\x08GetVideo\x12\x13.video.VideoRequest\x1a\x14.video.VideoResponse\x12\x46\n\x11UpdateVideoStatus\x12\x1a.video.UpdateStatusRequest\x1a\x15.video.StatusResponse\x12:\n\x0eGetVideoChunks\x12\x13.video.ChunkRequest\x1a\x11.video.VideoChunk0\x01\x12Q\n\x17ReportTranscodeProgress\x12\x1f.video.TranscodeProgressRequest\x1a\x15.video.StatusResponse\x12G\n\x0eGetQueueStatus\x12\x19.video.QueueStatusRequest\x1a\x1a.video.QueueStatusResponse\x12\x41\n\nListVideos\x12\x18.video.ListVideosRequest\x1a\x19.video.ListVideosResponse\x12\x45\n\x0cSearchVideos\x12\x1a.video.SearchVideosRequest\x1a\x19.video.ListVideosResponse\x12?\n\rGetVideoStats\x12\x13.video.VideoRequest\x1a\x19.video.VideoStatsResponse\x12P\n\x11\x42\x61tchUpdateStatus\x12\x1f.video.BatchUpdateStatusRequest\x1a\x1a.video.BatchStatusResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bvideo.proto\x12\x05video\":\n\x0cVideoRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x18\n\x10include_metadata\x18\x02 \x01(\x08\"\xf3\x01\n\rVideoResponse\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x11\n\tfile_size\x18\x04 \x01(\x03\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x11\n\tmime_type\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x34\n\x08metadata\x18\x08 \x03(\x0b\x32\".video.VideoResponse.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"[\n\x13UpdateStatusRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x11\n\tworker_id\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\"E\n\x0eStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"U\n\x0c\x43hunkRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x12\n\nchunk_size\x18\x03 \x01(\x05\x12\x0f\n\x07quality\x18\x04 \x01(\t\"I\n\nVideoChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0c\n\x04size\x18\x03 \x01(\x05\x12\x0f\n\x07is_last\x18\x04 \x01(\x08\"7\n\x12\x44ownloadURLRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x0f\n\x07quality\x18\x02 \x01(\t\"0\n\x13\x44ownloadURLResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\"\x83\x01\n\x18TranscodeProgressRequest\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x18\n\x10progress_percent\x18\x03 \x01(\x05\x12\x17\n\x0f\x63urrent_quality\x18\x04 \x01(\t\x12\x0f\n\x07message\x18\x05 \x01(\t\"O\n\x1dTranscodeProgressBatchRequest\x12.\n\x05items\x18\x01 \x03(\x0b\x32\x1f.video.TranscodeProgressRequest\"(\n\x12QueueStatusRequest\x12\x12\n\nqueue_name\x18\x01 \x01(\t\"V\n\x13QueueStatusResponse\x12\x14\n\x0cpending_jobs\x18\x01 \x01(\x05\x12\x16\n\x0e\x61\x63tive_workers\x18\x02 \x01(\x05\x12\x11\n\tvideo_ids\x18\x03 \x03(\t\"j\n\x11ListVideosRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x10\n\x08per_page\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x13\n\x0buploader_id\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x05 \x01(\t\"i\n\x12ListVideosResponse\x12$\n\x06videos\x18\x01 \x03(\x0b\x32\x14.video.VideoResponse\x12\r\n\x05total\x18\x02 \x01(\x05\x12\x0c\n\x04page\x18\x03 \x01(\x05\x12\x10\n\x08per_page\x18\x04 \x01(\x05\"D\n\x13SearchVideosRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\x10\n\x08per_page\x18\x03 \x01(\x05\"\xfb\x01\n\x12VideoStatsResponse\x12\x10\n\x08video_id\x18\x01 \x01(\t\x12\x12\n\nview_count\x18\x02 \x01(\x03\x12\x12\n\nlike_count\x18\x03 \x01(\x03\x12\x1a\n\x12total_bytes_served\x18\x04 \x01(\x03\x12\x16\n\x0etotal_requests\x18\x05 \x01(\x03\x12\x42\n\rquality_stats\x18\x06 \x03(\x0b\x32+.video.VideoStatsResponse.QualityStatsEntry\x1a\x33\n\x11QualityStatsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"P\n\x18\x42\x61tchUpdateStatusRequest\x12\x11\n\tvideo_ids\x18\x01 \x03(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x11\n\tworker_id\x18\x03 \x01(\t\"]\n\x13\x42\x61tchStatusResponse\x12\x15\n\rsuccess_count\x18\x01 \x01(\x05\x12\x15\n\rfailure_count\x18\x02 \x01(\x05\x12\x18\n\x10\x66\x61iled_video_ids\x18\x03 \x03(\t2\xcf\x07\n\x0cVideoService\x12\x35\n\x08GetVideo\x12\x13.video.VideoRequest\x1a\x14.video.VideoResponse\x12\x46\n\x11UpdateVideoStatus\x12\x1a.video.UpdateStatusRequest\x1a\x15.video.StatusResponse\x12:\n\x0eGetVideoChunks\x12\x13.video.ChunkRequest\x1a\x11.video.VideoChunk0\x01\x12\x45\n\x17GetVideoChunksStreaming\x12\x13.video.ChunkRequest\x1a\x11.video.VideoChunk(\x01\x30\x01\x12L\n\x13GetVideoDownloadURL\x12\x19.video.DownloadURLRequest\x1a\x1a.video.DownloadURLResponse\x12Q\n\x17ReportTranscodeProgress\x12\x1f.video.TranscodeProgressRequest\x1a\x15.video.StatusResponse\x12[\n\x1cReportTranscodeProgressBatch\x12$.video.TranscodeProgressBatchRequest\x1a\x15.video.StatusResponse\x12Y\n\x1dReportTranscodeProgressStream\x12\x1f.video.TranscodeProgressRequest\x1a\x15.video.StatusResponse(\x01\x12G\n\x0eGetQueueStatus\x12\x19.video.QueueStatusRequest\x1a\x1a.video.QueueStatusResponse\x12\x41\n\nListVideos\x12\x18.video.ListVideosRequest\x1a\x19.video.ListVideosResponse\x12\x45\n\x0cSearchVideos\x12\x1a.video.SearchVideosRequest\x1a\x19.video.ListVideosResponse\x12?\n\rGetVideoStats\x12\x13.video.VideoRequest\x1a\x19.video.VideoStatsResponse\x12P\n\x11\x42\x61tchUpdateStatus\x12\x1f.video.BatchUpdateStatusRequest\x1a\x1a.video.BatchStatusResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -49,26 +49,32 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_CHUNKREQUEST']._serialized_end=577
   _globals['_VIDEOCHUNK']._serialized_start=579
   _globals['_VIDEOCHUNK']._serialized_end=652
-  _globals['_TRANSCODEPROGRESSREQUEST']._serialized_start=655
-  _globals['_TRANSCODEPROGRESSREQUEST']._serialized_end=786
-  _globals['_QUEUESTATUSREQUEST']._serialized_start=788
-  _globals['_QUEUESTATUSREQUEST']._serialized_end=828
-  _globals['_QUEUESTATUSRESPONSE']._serialized_start=830
-  _globals['_QUEUESTATUSRESPONSE']._serialized_end=916
-  _globals['_LISTVIDEOSREQUEST']._serialized_start=918
-  _globals['_LISTVIDEOSREQUEST']._serialized_end=1024
-  _globals['_LISTVIDEOSRESPONSE']._serialized_start=1026
-  _globals['_LISTVIDEOSRESPONSE']._serialized_end=1131
-  _globals['_SEARCHVIDEOSREQUEST']._serialized_start=1133
-  _globals['_SEARCHVIDEOSREQUEST']._serialized_end=1201
-  _globals['_VIDEOSTATSRESPONSE']._serialized_start=1204
-  _globals['_VIDEOSTATSRESPONSE']._serialized_end=1455
-  _globals['_VIDEOSTATSRESPONSE_QUALITYSTATSENTRY']._serialized_start=1404
-  _globals['_VIDEOSTATSRESPONSE_QUALITYSTATSENTRY']._serialized_end=1455
-  _globals['_BATCHUPDATESTATUSREQUEST']._serialized_start=1457
-  _globals['_BATCHUPDATESTATUSREQUEST']._serialized_end=1537
-  _globals['_BATCHSTATUSRESPONSE']._serialized_start=1539
-  _globals['_BATCHSTATUSRESPONSE']._serialized_end=1632
-  _globals['_VIDEOSERVICE']._serialized_start=1635
-  _globals['_VIDEOSERVICE']._serialized_end=2277
+  _globals['_DOWNLOADURLREQUEST']._serialized_start=654
+  _globals['_DOWNLOADURLREQUEST']._serialized_end=709
+  _globals['_DOWNLOADURLRESPONSE']._serialized_start=711
+  _globals['_DOWNLOADURLRESPONSE']._serialized_end=759
+  _globals['_TRANSCODEPROGRESSREQUEST']._serialized_start=762
+  _globals['_TRANSCODEPROGRESSREQUEST']._serialized_end=893
+  _globals['_TRANSCODEPROGRESSBATCHREQUEST']._serialized_start=895
+  _globals['_TRANSCODEPROGRESSBATCHREQUEST']._serialized_end=974
+  _globals['_QUEUESTATUSREQUEST']._serialized_start=976
+  _globals['_QUEUESTATUSREQUEST']._serialized_end=1016
+  _globals['_QUEUESTATUSRESPONSE']._serialized_start=1018
+  _globals['_QUEUESTATUSRESPONSE']._serialized_end=1104
+  _globals['_LISTVIDEOSREQUEST']._serialized_start=1106
+  _globals['_LISTVIDEOSREQUEST']._serialized_end=1212
+  _globals['_LISTVIDEOSRESPONSE']._serialized_start=1214
+  _globals['_LISTVIDEOSRESPONSE']._serialized_end=1319
+  _globals['_SEARCHVIDEOSREQUEST']._serialized_start=1321
+  _globals['_SEARCHVIDEOSREQUEST']._serialized_end=1389
+  _globals['_VIDEOSTATSRESPONSE']._serialized_start=1392
+  _globals['_VIDEOSTATSRESPONSE']._serialized_end=1643
+  _globals['_VIDEOSTATSRESPONSE_QUALITYSTATSENTRY']._serialized_start=1592
+  _globals['_VIDEOSTATSRESPONSE_QUALITYSTATSENTRY']._serialized_end=1643
+  _globals['_BATCHUPDATESTATUSREQUEST']._serialized_start=1645
+  _globals['_BATCHUPDATESTATUSREQUEST']._serialized_end=1725
+  _globals['_BATCHSTATUSRESPONSE']._serialized_start=1727
+  _globals['_BATCHSTATUSRESPONSE']._serialized_end=1820
+  _globals['_VIDEOSERVICE']._serialized_start=1823
+  _globals['_VIDEOSERVICE']._serialized_end=2798
 # @@protoc_insertion_point(module_scope)
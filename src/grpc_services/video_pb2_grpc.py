@@ -58,11 +58,31 @@ class VideoServiceStub(object):
                 request_serializer=video__pb2.ChunkRequest.SerializeToString,
                 response_deserializer=video__pb2.VideoChunk.FromString,
                 _registered_method=True)
+        self.GetVideoChunksStreaming = channel.stream_stream(
+                '/video.VideoService/GetVideoChunksStreaming',
+                request_serializer=video__pb2.ChunkRequest.SerializeToString,
+                response_deserializer=video__pb2.VideoChunk.FromString,
+                _registered_method=True)
+        self.GetVideoDownloadURL = channel.unary_unary(
+                '/video.VideoService/GetVideoDownloadURL',
+                request_serializer=video__pb2.DownloadURLRequest.SerializeToString,
+                response_deserializer=video__pb2.DownloadURLResponse.FromString,
+                _registered_method=True)
         self.ReportTranscodeProgress = channel.unary_unary(
                 '/video.VideoService/ReportTranscodeProgress',
                 request_serializer=video__pb2.TranscodeProgressRequest.SerializeToString,
                 response_deserializer=video__pb2.StatusResponse.FromString,
                 _registered_method=True)
+        self.ReportTranscodeProgressBatch = channel.unary_unary(
+                '/video.VideoService/ReportTranscodeProgressBatch',
+                request_serializer=video__pb2.TranscodeProgressBatchRequest.SerializeToString,
+                response_deserializer=video__pb2.StatusResponse.FromString,
+                _registered_method=True)
+        self.ReportTranscodeProgressStream = channel.stream_unary(
+                '/video.VideoService/ReportTranscodeProgressStream',
+                request_serializer=video__pb2.TranscodeProgressRequest.SerializeToString,
+                response_deserializer=video__pb2.StatusResponse.FromString,
+                _registered_method=True)
         self.GetQueueStatus = channel.unary_unary(
                 '/video.VideoService/GetQueueStatus',
                 request_serializer=video__pb2.QueueStatusRequest.SerializeToString,
@@ -115,6 +135,20 @@ class VideoServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetVideoChunksStreaming(self, request_iterator, context):
+        """Long-lived chunk stream for a playback session; each request seeks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetVideoDownloadURL(self, request, context):
+        """HTTP URL for bulk download of a video file, served with Range support
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ReportTranscodeProgress(self, request, context):
         """Report transcoding progress
         """
@@ -122,6 +156,20 @@ class VideoServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ReportTranscodeProgressBatch(self, request, context):
+        """Report several progress updates in one call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReportTranscodeProgressStream(self, request_iterator, context):
+        """Progress updates for one transcode job over a single client stream
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetQueueStatus(self, request, context):
         """Get transcoding queue status
         """
@@ -175,11 +223,31 @@ def add_VideoServiceServicer_to_server(servicer, server):
                     request_deserializer=video__pb2.ChunkRequest.FromString,
                     response_serializer=video__pb2.VideoChunk.SerializeToString,
             ),
+            'GetVideoChunksStreaming': grpc.stream_stream_rpc_method_handler(
+                    servicer.GetVideoChunksStreaming,
+                    request_deserializer=video__pb2.ChunkRequest.FromString,
+                    response_serializer=video__pb2.VideoChunk.SerializeToString,
+            ),
+            'GetVideoDownloadURL': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetVideoDownloadURL,
+                    request_deserializer=video__pb2.DownloadURLRequest.FromString,
+                    response_serializer=video__pb2.DownloadURLResponse.SerializeToString,
+            ),
             'ReportTranscodeProgress': grpc.unary_unary_rpc_method_handler(
                     servicer.ReportTranscodeProgress,
                     request_deserializer=video__pb2.TranscodeProgressRequest.FromString,
                     response_serializer=video__pb2.StatusResponse.SerializeToString,
             ),
+            'ReportTranscodeProgressBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReportTranscodeProgressBatch,
+                    request_deserializer=video__pb2.TranscodeProgressBatchRequest.FromString,
+                    response_serializer=video__pb2.StatusResponse.SerializeToString,
+            ),
+            'ReportTranscodeProgressStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.ReportTranscodeProgressStream,
+                    request_deserializer=video__pb2.TranscodeProgressRequest.FromString,
+                    response_serializer=video__pb2.StatusResponse.SerializeToString,
+            ),
             'GetQueueStatus': grpc.unary_unary_rpc_method_handler(
                     servicer.GetQueueStatus,
                     request_deserializer=video__pb2.QueueStatusRequest.FromString,
@@ -298,6 +366,60 @@ class VideoService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetVideoChunksStreaming(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/video.VideoService/GetVideoChunksStreaming',
+            video__pb2.ChunkRequest.SerializeToString,
+            video__pb2.VideoChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetVideoDownloadURL(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/video.VideoService/GetVideoDownloadURL',
+            video__pb2.DownloadURLRequest.SerializeToString,
+            video__pb2.DownloadURLResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ReportTranscodeProgress(request,
             target,
@@ -325,6 +447,60 @@ class VideoService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ReportTranscodeProgressBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/video.VideoService/ReportTranscodeProgressBatch',
+            video__pb2.TranscodeProgressBatchRequest.SerializeToString,
+            video__pb2.StatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReportTranscodeProgressStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/video.VideoService/ReportTranscodeProgressStream',
+            video__pb2.TranscodeProgressRequest.SerializeToString,
+            video__pb2.StatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetQueueStatus(request,
             target,
@@ -8,6 +8,7 @@ import sys
 import json
 import time
 import uuid
+import queue
 import logging
 from datetime import datetime
 import pika
@@ -50,6 +51,36 @@ engine = create_engine(Config.DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine)
 
 
+class ProgressStream:
+    """Progress updates for one transcode job, sent over a single client stream"""
+
+    def __init__(self, stub):
+        self._queue = queue.Queue()
+        self._future = stub.ReportTranscodeProgressStream.future(self._requests())
+
+    def _requests(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            yield request
+
+    def done(self) -> bool:
+        """True once the call has ended, e.g. because the server went away"""
+        return self._future.done()
+
+    def send(self, request) -> None:
+        self._queue.put(request)
+
+    def close(self, timeout: float = 10) -> None:
+        """End the stream and wait for the server's acknowledgement (best-effort)."""
+        self._queue.put(None)
+        try:
+            self._future.result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Progress stream failed: {e}")
+
+
 class PushWorker:
     """Push-based worker that subscribes to RabbitMQ exchange"""
 
@@ -60,6 +91,7 @@ class PushWorker:
         self.queue_name = None  # Dynamic queue name
         self.grpc_channel = None
         self.grpc_stub = None
+        self.progress_stream = None  # Open for the job being transcoded
 
         # Ensure DB metadata exists (in case migrations not run yet)
         try:
@@ -161,7 +193,10 @@ class PushWorker:
                 current_quality=quality,
                 message=message or ""
             )
-            self.grpc_stub.ReportTranscodeProgress(request)
+            if self.progress_stream is not None and not self.progress_stream.done():
+                self.progress_stream.send(request)
+            else:
+                self.grpc_stub.ReportTranscodeProgress(request)
         except Exception as e:
             logger.debug(f"Progress report failed: {e}")
 
@@ -181,6 +216,13 @@ class PushWorker:
             # Update status to transcoding
             self.update_video_status(video_id, VideoStatus.TRANSCODING, f"Worker {self.worker_id} started")
 
+            # One progress stream for the whole job instead of a call per update
+            if self.grpc_stub and video_pb2:
+                try:
+                    self.progress_stream = ProgressStream(self.grpc_stub)
+                except Exception as e:
+                    logger.debug(f"Progress stream unavailable: {e}")
+
             # Initialize transcoder
             transcoder = VideoTranscoder(Config)
 
@@ -245,6 +287,11 @@ class PushWorker:
             self.update_video_status(video_id, VideoStatus.FAILED, str(e))
             return False
 
+        finally:
+            if self.progress_stream is not None:
+                self.progress_stream.close()
+                self.progress_stream = None
+
     def subscribe_and_process(self) -> None:
         """Subscribe to exchange and process incoming jobs."""
         logger.info(
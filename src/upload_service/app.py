@@ -89,12 +89,19 @@ def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
 
+HASH_READ_SIZE = 1024 * 1024  # 1MB blocks keep per-update() overhead negligible
+
 def calculate_file_hash(filepath):
     """Calculate SHA256 hash of file"""
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+    sha256_hash = hashlib.sha256(usedforsecurity=False)
+    buf = bytearray(HASH_READ_SIZE)
+    view = memoryview(buf)
+    with open(filepath, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            sha256_hash.update(view[:n])
     return sha256_hash.hexdigest()
 
 # Import and initialize routes after app is created
@@ -51,6 +51,14 @@ class Video(Base):
     __table_args__ = (
         Index('idx_status_created', 'status', 'created_at'),
         Index('idx_uploader_status', 'uploader_id', 'status'),
+        # Covers the gRPC GetVideo lookup so it can be an index-only scan
+        Index(
+            'idx_videos_get_video', 'id',
+            postgresql_include=[
+                'title', 'filename', 'file_size', 'status', 'mime_type', 'created_at',
+                'original_filename', 'upload_method', 'file_hash'
+            ]
+        ),
     )
     
     def to_dict(self):
@@ -89,4 +97,9 @@ class UploadMetrics(Base):
     upload_duration = Column(Integer, nullable=False)
     throughput = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    # Serves the per-method "latest 100" metrics queries as an index range scan
+    __table_args__ = (
+        Index('ix_upload_metrics_method_created_at', 'upload_method', created_at.desc()),
+    )
 
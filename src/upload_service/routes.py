@@ -116,8 +116,9 @@ def init_routes(app, Session, publish_transcode_job, calculate_file_hash):
             db.commit()
         
         # Calculate metrics
-            upload_duration = int((time.time() - start_time) * 1000)
-            throughput = int(file_size / (time.time() - start_time)) if (time.time() - start_time) > 0 else 0
+            elapsed = max(time.time() - start_time, 1e-9)
+            upload_duration = int(elapsed * 1000)
+            throughput = int(file_size / elapsed)
         
         # Store metrics
             metrics = UploadMetrics(